@@ -21,8 +21,18 @@ For more documentation on ``sagemaker_core.shapes``, see:
 
 from __future__ import absolute_import
 
-from typing import Optional, Union, List
-from pydantic import BaseModel, model_validator, ConfigDict
+import sys
+from typing import Annotated, Any, Dict, Optional, Union, List
+from typing_extensions import Self
+from pydantic import (
+    BaseModel,
+    model_validator,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag as UnionTag,
+    TypeAdapter,
+)
 
 import sagemaker_core.shapes as shapes
 
@@ -72,9 +82,113 @@ __all__ = [
     "MetricDefinition",
 ]
 
+_ResourceConfig = shapes.ResourceConfig
+_VpcConfig = shapes.VpcConfig
+
+_RESOURCE_CONFIG_FIELDS = frozenset(_ResourceConfig.__annotations__)
+_VPC_CONFIG_FIELDS = frozenset(_VpcConfig.__annotations__)
+
+
+def _data_source_tag(value: Any) -> Optional[str]:
+    """Pick the ``InputData.data_source`` union member for ``value`` without trying each one."""
+    if isinstance(value, (str, bytes, bytearray)):
+        return "str"
+    if isinstance(value, S3DataSource):
+        return "s3"
+    if isinstance(value, FileSystemDataSource):
+        return "fs"
+    if isinstance(value, dict):
+        if "s3_uri" in value or "s3_data_type" in value:
+            return "s3"
+        if "file_system_id" in value or "directory_path" in value:
+            return "fs"
+    return None
+
+
+_DataSourceType = Annotated[
+    Union[
+        Annotated[str, UnionTag("str")],
+        Annotated[FileSystemDataSource, UnionTag("fs")],
+        Annotated[S3DataSource, UnionTag("s3")],
+    ],
+    Discriminator(
+        _data_source_tag,
+        custom_error_type="invalid_data_source",
+        custom_error_message=(
+            "data_source must be an S3 URI or local path string, an S3DataSource, "
+            "or a FileSystemDataSource"
+        ),
+    ),
+]
+
+_DEFAULT_IGNORE_PATTERNS = tuple(
+    sys.intern(pattern)
+    for pattern in (
+        ".env",
+        ".git",
+        "__pycache__",
+        ".DS_Store",
+        ".cache",
+        ".ipynb_checkpoints",
+    )
+)
+
+_TB_DEFAULT = sys.intern("/opt/ml/output/tensorboard")
+_CKPT_DEFAULT = sys.intern("/opt/ml/checkpoints")
+
+
+def _project(instance: BaseModel, target_cls: type, field_set: frozenset) -> Optional[BaseModel]:
+    """Project the non-None ``field_set`` values of ``instance`` onto ``target_cls``.
+
+    The values are already validated on ``instance``, so validation is skipped.
+    ``model_construct`` does not rebuild nested models, so the field values are read directly
+    rather than from a dump. Returns None if none of the fields are set.
+    """
+    if not any(getattr(instance, k, None) is not None for k in field_set):
+        return None
+    values = {k: v for k in field_set if (v := getattr(instance, k, None)) is not None}
+    return target_cls.model_construct(**values)
+
+
+def _unassigned_default_fields(model_cls: type) -> frozenset:
+    """Get the fields of ``model_cls`` that default to ``Unassigned``."""
+    return frozenset(
+        name
+        for name, field in model_cls.model_fields.items()
+        if isinstance(field.default, shapes.Unassigned)
+    )
+
 
 class BaseConfig(BaseModel):
-    """BaseConfig"""
+    """BaseConfig
+
+    Base for configs that are built once and then passed along. Fields are validated on
+    construction only.
+    """
+
+    model_config = ConfigDict(validate_assignment=False, extra="forbid")
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> Self:
+        """Create the config from a JSON string.
+
+        The JSON is parsed and validated in a single pass by ``model_validate_json``, without
+        building an intermediate ``dict``.
+
+        Args:
+            data (Union[str, bytes]): The JSON document to validate.
+        """
+        return cls.model_validate_json(data)
+
+
+class MutableBaseConfig(BaseConfig):
+    """MutableBaseConfig
+
+    Base for configs whose fields users may reassign after construction, such as the
+    distributed configs in ``sagemaker.modules.distributed``. Assignments are validated so
+    user mistakes surface at the assignment rather than in the training job. The SDK itself
+    does not reassign fields on these configs.
+    """
 
     model_config = ConfigDict(validate_assignment=True, extra="forbid")
 
@@ -107,14 +221,9 @@ class SourceCode(BaseConfig):
     requirements: Optional[str] = None
     entry_script: Optional[str] = None
     command: Optional[str] = None
-    ignore_patterns: Optional[List[str]] = [
-        ".env",
-        ".git",
-        "__pycache__",
-        ".DS_Store",
-        ".cache",
-        ".ipynb_checkpoints",
-    ]
+    ignore_patterns: Optional[List[str]] = Field(
+        default_factory=lambda: list(_DEFAULT_IGNORE_PATTERNS)
+    )
 
 
 class Compute(shapes.ResourceConfig):
@@ -156,20 +265,15 @@ class Compute(shapes.ResourceConfig):
     @model_validator(mode="after")
     def _model_validator(self) -> "Compute":
         """Convert Unassigned values to None."""
-        return convert_unassigned_to_none(self)
+        return convert_unassigned_to_none(self, _COMPUTE_UNASSIGNED_FIELDS)
 
     def _to_resource_config(self) -> shapes.ResourceConfig:
         """Convert to a sagemaker_core.shapes.ResourceConfig object."""
-        compute_config_dict = self.model_dump()
-        resource_config_fields = set(shapes.ResourceConfig.__annotations__.keys())
-        filtered_dict = {
-            k: v
-            for k, v in compute_config_dict.items()
-            if k in resource_config_fields and v is not None
-        }
-        if not filtered_dict:
-            return None
-        return shapes.ResourceConfig(**filtered_dict)
+        return _project(self, _ResourceConfig, _COMPUTE_PROJECTION_FIELDS)
+
+
+_COMPUTE_PROJECTION_FIELDS = frozenset(Compute.model_fields) & _RESOURCE_CONFIG_FIELDS
+_COMPUTE_UNASSIGNED_FIELDS = _unassigned_default_fields(Compute)
 
 
 class Networking(shapes.VpcConfig):
@@ -205,18 +309,15 @@ class Networking(shapes.VpcConfig):
     @model_validator(mode="after")
     def _model_validator(self) -> "Networking":
         """Convert Unassigned values to None."""
-        return convert_unassigned_to_none(self)
+        return convert_unassigned_to_none(self, _NETWORKING_UNASSIGNED_FIELDS)
 
     def _to_vpc_config(self) -> shapes.VpcConfig:
         """Convert to a sagemaker_core.shapes.VpcConfig object."""
-        compute_config_dict = self.model_dump()
-        vpc_config_fields = set(shapes.VpcConfig.__annotations__.keys())
-        filtered_dict = {
-            k: v for k, v in compute_config_dict.items() if k in vpc_config_fields and v is not None
-        }
-        if not filtered_dict:
-            return None
-        return shapes.VpcConfig(**filtered_dict)
+        return _project(self, _VpcConfig, _VPC_PROJECTION_FIELDS)
+
+
+_VPC_PROJECTION_FIELDS = frozenset(Networking.model_fields) & _VPC_CONFIG_FIELDS
+_NETWORKING_UNASSIGNED_FIELDS = _unassigned_default_fields(Networking)
 
 
 class InputData(BaseConfig):
@@ -232,6 +333,9 @@ class InputData(BaseConfig):
         import os
         input_data_dir = os.environ['SM_CHANNEL_<channel_name>']
 
+    InputData is immutable. Its fields cannot be reassigned after construction; create a new
+    InputData instead.
+
     Parameters:
         channel_name (str):
             The name of the input data source channel.
@@ -240,8 +344,24 @@ class InputData(BaseConfig):
             S3DataSource object, or FileSystemDataSource object.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     channel_name: str = None
-    data_source: Union[str, FileSystemDataSource, S3DataSource] = None
+    data_source: _DataSourceType = None
+
+    @classmethod
+    def from_list(cls, items: List[Dict[str, Any]]) -> List["InputData"]:
+        """Create a list of InputData from a list of dicts.
+
+        The whole list is validated in one call through a module-level ``TypeAdapter``.
+
+        Args:
+            items (List[Dict[str, Any]]): The InputData fields for each channel.
+        """
+        return _INPUT_DATA_LIST_ADAPTER.validate_python(items)
+
+
+_INPUT_DATA_LIST_ADAPTER = TypeAdapter(List[InputData])
 
 
 class OutputDataConfig(shapes.OutputDataConfig):
@@ -285,7 +405,7 @@ class TensorBoardOutputConfig(shapes.TensorBoardOutputConfig):
     """
 
     s3_output_path: Optional[str] = None
-    local_path: Optional[str] = "/opt/ml/output/tensorboard"
+    local_path: Optional[str] = _TB_DEFAULT
 
 
 class CheckpointConfig(shapes.CheckpointConfig):
@@ -304,4 +424,4 @@ class CheckpointConfig(shapes.CheckpointConfig):
     """
 
     s3_uri: Optional[str] = None
-    local_path: Optional[str] = "/opt/ml/checkpoints"
+    local_path: Optional[str] = _CKPT_DEFAULT
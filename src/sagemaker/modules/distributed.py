@@ -19,10 +19,10 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from sagemaker.modules.utils import safe_serialize
 from sagemaker.modules.constants import SM_DRIVERS_LOCAL_PATH
-from sagemaker.modules.configs import BaseConfig
+from sagemaker.modules.configs import MutableBaseConfig
 
 
-class SMP(BaseConfig):
+class SMP(MutableBaseConfig):
     """SMP.
 
     This class is used for configuring the SageMaker Model Parallelism v2 parameters.
@@ -76,7 +76,7 @@ class SMP(BaseConfig):
         return hyperparameters
 
 
-class DistributedConfig(BaseConfig, ABC):
+class DistributedConfig(MutableBaseConfig, ABC):
     """Abstract base class for distributed training configurations.
 
     This class defines the interface that all distributed training configurations
@@ -20,7 +20,7 @@ import tempfile
 from pathlib import Path
 
 from datetime import datetime
-from typing import Literal, Any
+from typing import Literal, Any, Iterable, Optional
 
 from sagemaker_core.shapes import Unassigned
 from sagemaker.modules import logger
@@ -116,11 +116,24 @@ def _get_repo_name_from_image(image: str) -> str:
     return image.split("/")[-1].split(":")[0]
 
 
-def convert_unassigned_to_none(instance) -> Any:
-    """Convert Unassigned values to None for any instance."""
-    for name, value in instance.__dict__.items():
-        if isinstance(value, Unassigned):
-            setattr(instance, name, None)
+def convert_unassigned_to_none(instance, field_names: Optional[Iterable[str]] = None) -> Any:
+    """Convert Unassigned values to None for any instance.
+
+    Values are written with ``object.__setattr__`` so that pydantic models with
+    ``validate_assignment`` enabled do not re-validate each converted field. As a result,
+    converted fields are not added to a pydantic model's ``model_fields_set`` and are still
+    dropped by ``model_dump(exclude_unset=True)``.
+
+    Args:
+        instance (Any): The instance to convert.
+        field_names (Optional[Iterable[str]]): The only attributes that can hold Unassigned.
+            If not specified, every attribute of the instance is checked.
+    """
+    if field_names is None:
+        field_names = list(instance.__dict__)
+    for name in field_names:
+        if isinstance(instance.__dict__.get(name), Unassigned):
+            object.__setattr__(instance, name, None)
     return instance
 
 
@@ -0,0 +1,173 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Configs Tests."""
+from __future__ import absolute_import
+
+import pytest
+from pydantic import ValidationError
+from sagemaker_core.shapes import ResourceConfig, VpcConfig
+
+from sagemaker.modules.configs import (
+    Compute,
+    Networking,
+    InstanceGroup,
+    SourceCode,
+    InputData,
+    S3DataSource,
+    FileSystemDataSource,
+)
+from sagemaker.modules.distributed import SMP
+
+
+def test_compute_to_resource_config():
+    instance_group = InstanceGroup(
+        instance_type="ml.m5.xlarge", instance_count=2, instance_group_name="group-1"
+    )
+    compute = Compute(
+        instance_groups=[instance_group],
+        volume_size_in_gb=50,
+        enable_managed_spot_training=True,
+    )
+
+    resource_config = compute._to_resource_config()
+
+    assert resource_config == ResourceConfig(instance_groups=[instance_group], volume_size_in_gb=50)
+    assert isinstance(resource_config.instance_groups[0], InstanceGroup)
+
+
+def test_compute_to_resource_config_empty():
+    assert Compute(volume_size_in_gb=None)._to_resource_config() is None
+
+
+def test_networking_to_vpc_config():
+    networking = Networking(
+        security_group_ids=["sg-123"],
+        subnets=["subnet-123"],
+        enable_network_isolation=True,
+    )
+
+    assert networking._to_vpc_config() == VpcConfig(
+        security_group_ids=["sg-123"], subnets=["subnet-123"]
+    )
+
+
+def test_source_code_default_ignore_patterns_not_shared():
+    source_code = SourceCode()
+    source_code.ignore_patterns.append("data")
+
+    assert SourceCode().ignore_patterns == [
+        ".env",
+        ".git",
+        "__pycache__",
+        ".DS_Store",
+        ".cache",
+        ".ipynb_checkpoints",
+    ]
+
+
+def test_input_data_is_frozen():
+    input_data = InputData(channel_name="train", data_source="s3://bucket/train")
+
+    with pytest.raises(ValidationError):
+        input_data.data_source = "s3://bucket/other"
+
+
+def test_source_code_from_json():
+    source_code = SourceCode.from_json(
+        '{"source_dir": "s3://bucket/code", "entry_script": "train.py"}'
+    )
+
+    assert source_code == SourceCode(source_dir="s3://bucket/code", entry_script="train.py")
+
+
+def test_from_json_forbids_extra_fields():
+    with pytest.raises(ValidationError):
+        InputData.from_json(b'{"channel_name": "train", "unknown": "value"}')
+
+
+@pytest.mark.parametrize(
+    "data_source,expected_type",
+    [
+        ("s3://bucket/train", str),
+        (b"s3://bucket/train", str),
+        (S3DataSource(s3_data_type="S3Prefix", s3_uri="s3://bucket/train"), S3DataSource),
+        ({"s3_data_type": "S3Prefix", "s3_uri": "s3://bucket/train"}, S3DataSource),
+        (
+            {
+                "file_system_id": "fs-123",
+                "file_system_access_mode": "ro",
+                "file_system_type": "EFS",
+                "directory_path": "/data",
+            },
+            FileSystemDataSource,
+        ),
+    ],
+    ids=["str", "bytes", "s3_data_source", "s3_data_source_dict", "file_system_data_source_dict"],
+)
+def test_input_data_data_source(data_source, expected_type):
+    input_data = InputData(channel_name="train", data_source=data_source)
+
+    assert isinstance(input_data.data_source, expected_type)
+
+
+@pytest.mark.parametrize("data_source", [None, 1, {}, {"foo": 1}])
+def test_input_data_invalid_data_source(data_source):
+    with pytest.raises(ValidationError) as e:
+        InputData(channel_name="train", data_source=data_source)
+
+    assert (
+        "data_source must be an S3 URI or local path string, an S3DataSource, "
+        "or a FileSystemDataSource"
+    ) in str(e.value)
+
+
+def test_input_data_from_list():
+    input_data = InputData.from_list(
+        [
+            {"channel_name": "train", "data_source": "s3://bucket/train"},
+            {
+                "channel_name": "validation",
+                "data_source": {"s3_data_type": "S3Prefix", "s3_uri": "s3://bucket/validation"},
+            },
+        ]
+    )
+
+    assert input_data == [
+        InputData(channel_name="train", data_source="s3://bucket/train"),
+        InputData(
+            channel_name="validation",
+            data_source=S3DataSource(s3_data_type="S3Prefix", s3_uri="s3://bucket/validation"),
+        ),
+    ]
+
+
+def test_compute_equality_unchanged_after_conversion():
+    compute = Compute(instance_type="ml.m5.xlarge", instance_count=1)
+    compute._to_resource_config()
+
+    assert compute == Compute(instance_type="ml.m5.xlarge", instance_count=1)
+
+
+def test_source_code_assignment_not_validated():
+    source_code = SourceCode()
+
+    source_code.entry_script = 1
+
+    assert source_code.entry_script == 1
+
+
+def test_mutable_base_config_assignment_validated():
+    smp = SMP()
+
+    with pytest.raises(ValidationError):
+        smp.random_seed = "not-an-int"
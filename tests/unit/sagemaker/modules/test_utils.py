@@ -14,6 +14,7 @@
 from __future__ import absolute_import
 
 import pytest
+from sagemaker_core.shapes import ResourceConfig, Unassigned
 
 from tests.unit import DATA_DIR
 from sagemaker.modules.utils import (
@@ -21,6 +22,7 @@ from sagemaker.modules.utils import (
     _is_valid_path,
     _get_unique_name,
     _get_repo_name_from_image,
+    convert_unassigned_to_none,
 )
 
 
@@ -138,3 +140,26 @@ def test_get_unique_name(test_case):
 )
 def test_get_repo_name_from_image(test_case):
     assert _get_repo_name_from_image(test_case["image"]) == test_case["expected"]
+
+
+def test_convert_unassigned_to_none():
+    resource_config = ResourceConfig(instance_type="ml.m5.xlarge", volume_size_in_gb=30)
+    assert isinstance(resource_config.instance_count, Unassigned)
+
+    result = convert_unassigned_to_none(resource_config)
+
+    assert result is resource_config
+    assert resource_config.instance_type == "ml.m5.xlarge"
+    assert resource_config.volume_size_in_gb == 30
+    assert resource_config.instance_count is None
+    assert resource_config.instance_groups is None
+    assert resource_config.model_fields_set == {"instance_type", "volume_size_in_gb"}
+
+
+def test_convert_unassigned_to_none_with_field_names():
+    resource_config = ResourceConfig(instance_type="ml.m5.xlarge", volume_size_in_gb=30)
+
+    convert_unassigned_to_none(resource_config, ["instance_count"])
+
+    assert resource_config.instance_count is None
+    assert isinstance(resource_config.instance_groups, Unassigned)